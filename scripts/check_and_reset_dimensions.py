@@ -4,7 +4,8 @@
 import shutil
 from pathlib import Path
 
-import xarray as xr
+from fs_utils import discard_tree
+from zarr_metadata import open_group
 
 
 def check_and_reset_dimensions() -> None:
@@ -13,37 +14,42 @@ def check_and_reset_dimensions() -> None:
 
     for zarr_path in data_dir.glob("*.zarr"):
         try:
-            # Try to open the dataset
-            ds = xr.open_zarr(zarr_path, consolidated=True)
+            # Read array metadata directly; no xarray dataset is needed
+            group = open_group(zarr_path)
 
             # Check for dimension issues
-            if "init_time" in ds.dims:
-                init_time_size = ds.dims["init_time"]
-                actual_size = len(ds.init_time.values)
-
-                if init_time_size != actual_size:
-                    print(f"Dimension mismatch in {zarr_path}: {init_time_size} != {actual_size}")
+            if "init_time" in group:
+                init_time_size = group["init_time"].shape[0]
+
+                # Every array along init_time must agree with the coordinate
+                mismatched = {}
+                for name, array in group.arrays():
+                    dims = array.attrs.get("_ARRAY_DIMENSIONS", [])
+                    if "init_time" in dims:
+                        actual_size = array.shape[dims.index("init_time")]
+                        if actual_size != init_time_size:
+                            mismatched[name] = actual_size
+
+                if mismatched:
+                    print(f"Dimension mismatch in {zarr_path}: {init_time_size} != {mismatched}")
                     print("Resetting dataset...")
-                    ds.close()
 
                     # Backup and remove
                     backup_path = zarr_path.parent / f"{zarr_path.name}.backup"
                     if backup_path.exists():
-                        shutil.rmtree(backup_path)
+                        discard_tree(backup_path)
                     shutil.move(zarr_path, backup_path)
                     print(f"Backed up to {backup_path}")
                 else:
                     print(f"{zarr_path} dimensions OK")
-                    ds.close()
             else:
                 print(f"{zarr_path} has no init_time dimension")
-                ds.close()
 
         except Exception as e:
             print(f"Error checking {zarr_path}: {e}")
             print("Dataset may be corrupted, removing...")
             if zarr_path.exists():
-                shutil.rmtree(zarr_path)
+                discard_tree(zarr_path)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,138 @@
 """Clean up old forecast data to maintain rolling storage."""
 
 import argparse
-import shutil
-from datetime import datetime, timedelta
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 import xarray as xr
+import zarr
+
+from fs_utils import discard_tree
+from zarr_metadata import decode_times, load_consolidated_metadata, open_group
+
+
+def truncate_in_place(zarr_path: Path, append_dim: str, start: int) -> bool:
+    """Drop the leading ``start`` entries along ``append_dim`` without a full rewrite.
+
+    Surviving entries are shifted to the front one slab at a time, then every
+    array is resized, which deletes the orphaned chunk files.
+
+    Args:
+        zarr_path: Path to the Zarr store
+        append_dim: Dimension to truncate (must be the leading dimension)
+        start: Index of the first entry to keep
+
+    Returns:
+        True if the store was truncated, False if its layout is not supported
+    """
+    group = zarr.open_group(str(zarr_path), mode="r+")
+    arrays = [
+        array
+        for _, array in group.arrays()
+        if append_dim in array.attrs.get("_ARRAY_DIMENSIONS", [])
+    ]
+    if any(array.attrs["_ARRAY_DIMENSIONS"][0] != append_dim for array in arrays):
+        return False
+
+    for array in arrays:
+        size = array.shape[0]
+        if start > 0:
+            for dest, src in enumerate(range(start, size)):
+                if array.ndim > 1:
+                    # Copy one chunk row at a time to bound memory
+                    step = array.chunks[1]
+                    for k in range(0, array.shape[1], step):
+                        array[dest, k : k + step] = array[src, k : k + step]
+                else:
+                    array[dest] = array[src]
+        array.resize((size - start, *array.shape[1:]))
+
+    zarr.consolidate_metadata(str(zarr_path))
+    load_consolidated_metadata.cache_clear()
+    return True
+
+
+def rewrite_subset(zarr_path: Path, append_dim: str, keep_mask: np.ndarray) -> None:
+    """Rewrite the store keeping only the selected entries along ``append_dim``."""
+    ds = xr.open_zarr(zarr_path, consolidated=True)
+    ds_subset = ds.isel({append_dim: keep_mask})
+
+    # Create temporary zarr store
+    temp_path = zarr_path.parent / f"{zarr_path.name}.tmp"
+    if temp_path.exists():
+        discard_tree(temp_path)
+
+    # Write subset to temporary store
+    ds_subset.to_zarr(temp_path, mode="w", consolidated=True)
+    ds.close()
+    ds_subset.close()
+
+    # Replace original with cleaned version
+    discard_tree(zarr_path)
+    temp_path.rename(zarr_path)
+
+
+def cleanup_store(zarr_path: Path, max_age_hours: int, keep_latest_only: bool) -> None:
+    """Remove old forecast runs from a single Zarr store.
+
+    Args:
+        zarr_path: Path to the Zarr store
+        max_age_hours: Maximum age of forecasts to keep in hours (ignored if keep_latest_only=True)
+        keep_latest_only: If True, keep only the most recent forecast run(s)
+    """
+    try:
+        print(f"Processing {zarr_path}")
+
+        # Read only the init_time coordinate directly from zarr
+        group = open_group(zarr_path)
+
+        # Get the append dimension (usually 'init_time')
+        append_dim = "init_time"
+        if append_dim not in group:
+            print(f"Warning: {zarr_path} does not have '{append_dim}' dimension")
+            return
+
+        # Find indices to keep, working on the decoded numpy array directly
+        init_time = group[append_dim]
+        init_times = decode_times(init_time[:], init_time.attrs["units"])
+
+        if keep_latest_only:
+            # Keep only the most recent forecast run
+            max_init_time = init_times.max()
+            keep_mask = init_times == max_init_time
+            print(f"Keeping only latest forecast: {max_init_time}")
+        else:
+            # Keep forecasts within the time window (stored times are naive UTC)
+            now = np.datetime64(datetime.now(timezone.utc).replace(tzinfo=None), "ns")
+            cutoff_time = now - np.timedelta64(max_age_hours, "h")
+            keep_mask = init_times >= cutoff_time
+            print(f"Keeping forecasts after: {cutoff_time}")
+
+        # If we need to remove data
+        if not keep_mask.all():
+            num_to_remove = (~keep_mask).sum()
+            num_to_keep = keep_mask.sum()
+            print(f"Removing {num_to_remove} forecast runs, keeping {num_to_keep}")
+
+            # Appends grow init_time monotonically, so the runs to keep are
+            # normally a contiguous tail that can be truncated in place
+            keep_indices = np.flatnonzero(keep_mask)
+            start = int(keep_indices[0]) if keep_indices.size else len(keep_mask)
+            is_tail = np.array_equal(keep_indices, np.arange(start, len(keep_mask)))
+            if is_tail and truncate_in_place(zarr_path, append_dim, start):
+                print(f"Truncated {zarr_path} in place")
+            else:
+                rewrite_subset(zarr_path, append_dim, keep_mask)
+
+            print(f"Cleaned up {zarr_path}")
+        else:
+            print(f"No cleanup needed for {zarr_path}")
+
+    except Exception as e:
+        print(f"Error processing {zarr_path}: {e}")
 
 
 def cleanup_old_forecasts(max_age_hours: int = 24, keep_latest_only: bool = True) -> None:
@@ -19,73 +145,14 @@ def cleanup_old_forecasts(max_age_hours: int = 24, keep_latest_only: bool = True
     """
     data_dir = Path("data")
 
-    # Process each Zarr dataset
-    for zarr_path in data_dir.glob("*.zarr"):
-        try:
-            print(f"Processing {zarr_path}")
-
-            # Open the dataset
-            ds = xr.open_zarr(zarr_path, consolidated=True)
-
-            # Get the append dimension (usually 'init_time')
-            append_dim = "init_time"
-            if append_dim not in ds.dims:
-                print(f"Warning: {zarr_path} does not have '{append_dim}' dimension")
-                ds.close()
-                continue
-
-            # Find indices to keep
-            init_times = pd.DatetimeIndex(ds[append_dim].values)
-
-            # Ensure timezone-naive for comparison
-            if init_times.tz is not None:
-                init_times = init_times.tz_localize(None)
-
-            if keep_latest_only:
-                # Keep only the most recent forecast run
-                max_init_time = init_times.max()
-                keep_mask = init_times == max_init_time
-                print(f"Keeping only latest forecast: {max_init_time}")
-            else:
-                # Keep forecasts within the time window
-                cutoff_time = pd.Timestamp.now(tz="UTC") - timedelta(hours=max_age_hours)
-                cutoff_time_naive = cutoff_time.tz_localize(None)
-                keep_mask = init_times >= cutoff_time_naive
-                print(f"Keeping forecasts after: {cutoff_time_naive}")
-
-            ds.close()
-
-            # If we need to remove data
-            if not keep_mask.all():
-                num_to_remove = (~keep_mask).sum()
-                num_to_keep = keep_mask.sum()
-                print(f"Removing {num_to_remove} forecast runs, keeping {num_to_keep}")
-
-                # Reopen in write mode and select only data to keep
-                ds = xr.open_zarr(zarr_path, consolidated=True)
-                ds_subset = ds.isel({append_dim: keep_mask})
-
-                # Create temporary zarr store
-                temp_path = zarr_path.parent / f"{zarr_path.name}.tmp"
-                if temp_path.exists():
-                    shutil.rmtree(temp_path)
-
-                # Write subset to temporary store
-                ds_subset.to_zarr(temp_path, mode="w", consolidated=True)
-                ds.close()
-                ds_subset.close()
-
-                # Replace original with cleaned version
-                shutil.rmtree(zarr_path)
-                temp_path.rename(zarr_path)
-
-                print(f"Cleaned up {zarr_path}")
-            else:
-                print(f"No cleanup needed for {zarr_path}")
-
-        except Exception as e:
-            print(f"Error processing {zarr_path}: {e}")
-            continue
+    # Process each Zarr dataset concurrently; stores are independent
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        futures = [
+            executor.submit(cleanup_store, zarr_path, max_age_hours, keep_latest_only)
+            for zarr_path in data_dir.glob("*.zarr")
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
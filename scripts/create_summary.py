@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Create a summary document of available datasets."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import xarray as xr
+from zarr_metadata import decode_times, load_consolidated_metadata, open_group
 
 
 def format_size(size_bytes: int) -> str:
@@ -18,13 +20,80 @@ def format_size(size_bytes: int) -> str:
 
 def get_directory_size(path: Path) -> int:
     """Calculate total size of directory."""
+    # os.scandir reuses the directory entry type and stat info, avoiding the
+    # extra is_file()/stat() syscalls per entry that rglob incurs
     total = 0
-    for item in path.rglob("*"):
-        if item.is_file():
-            total += item.stat().st_size
+    stack = [str(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
     return total
 
 
+def summarize_store(zarr_path: Path) -> list[str]:
+    """Create the summary lines for a single Zarr store.
+
+    Everything except the latest init_time is read from the consolidated
+    metadata JSON, so no xarray dataset is constructed.
+    """
+    try:
+        metadata = load_consolidated_metadata(zarr_path)
+        attrs = metadata.get(".zattrs", {})
+
+        # Collect shapes, dimension sizes and coordinate names per array
+        shapes: dict[str, list[int]] = {}
+        dims: dict[str, int] = {}
+        coords: set[str] = set()
+        for key, value in metadata.items():
+            if key.endswith("/.zarray"):
+                shapes[key.removesuffix("/.zarray")] = value["shape"]
+        for name, shape in shapes.items():
+            array_attrs = metadata.get(f"{name}/.zattrs", {})
+            dims.update(zip(array_attrs.get("_ARRAY_DIMENSIONS", []), shape, strict=True))
+            coords.update(array_attrs.get("coordinates", "").split())
+
+        # Get basic info
+        dataset_id = zarr_path.stem
+        size = get_directory_size(zarr_path)
+
+        lines = [
+            "",
+            f"### {dataset_id}",
+            "",
+            f"**Storage Size:** {format_size(size)}",
+        ]
+
+        # Add metadata
+        if "title" in attrs:
+            lines += ["", f"**Title:** {attrs['title']}"]
+        if "description" in attrs:
+            lines += ["", f"**Description:** {attrs['description']}"]
+
+        # Dimensions
+        lines += ["", "**Dimensions:**"]
+        lines += [f"- {dim}: {length}" for dim, length in dims.items()]
+
+        # Variables
+        lines += ["", "**Variables:**"]
+        lines += [f"- {var}" for var in shapes if var not in dims and var not in coords]
+
+        # Time range
+        if "init_time" in shapes:
+            init_time = open_group(zarr_path)["init_time"]
+            latest = decode_times(init_time[-1:], init_time.attrs["units"])[0]
+            lines += ["", f"**Latest Forecast:** {latest}"]
+
+    except Exception as e:
+        print(f"Warning: Could not process {zarr_path}: {e}")
+        return []
+
+    return lines
+
+
 def create_summary() -> None:
     """Create a summary document of available datasets."""
     data_dir = Path("data")
@@ -32,56 +101,22 @@ def create_summary() -> None:
     summary_dir.mkdir(parents=True, exist_ok=True)
 
     summary_lines = [
-        "# NAM Pressure Levels Data Summary\n",
-        f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n",
-        "\n## Available Datasets\n",
+        "# NAM Pressure Levels Data Summary",
+        "",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}",
+        "",
+        "## Available Datasets",
     ]
 
-    # Process each Zarr dataset
-    for zarr_path in sorted(data_dir.glob("*.zarr")):
-        try:
-            ds = xr.open_zarr(zarr_path, consolidated=True)
-
-            # Get basic info
-            dataset_id = zarr_path.stem
-            size = get_directory_size(zarr_path)
-
-            summary_lines.append(f"\n### {dataset_id}\n")
-            summary_lines.append(f"\n**Storage Size:** {format_size(size)}\n")
-
-            # Add metadata
-            if "title" in ds.attrs:
-                summary_lines.append(f"\n**Title:** {ds.attrs['title']}\n")
-            if "description" in ds.attrs:
-                summary_lines.append(f"\n**Description:** {ds.attrs['description']}\n")
-
-            # Dimensions
-            summary_lines.append("\n**Dimensions:**\n")
-            for dim, size in ds.dims.items():
-                summary_lines.append(f"- {dim}: {size}\n")
-
-            # Variables
-            summary_lines.append("\n**Variables:**\n")
-            for var in ds.data_vars:
-                summary_lines.append(f"- {var}\n")
-
-            # Time range
-            if "init_time" in ds.dims:
-                init_times = ds.init_time.values
-                summary_lines.append(
-                    f"\n**Latest Forecast:** {init_times[-1]}\n"
-                )
-
-            ds.close()
-
-        except Exception as e:
-            print(f"Warning: Could not process {zarr_path}: {e}")
-            continue
+    # Process each Zarr dataset concurrently; store reads are I/O bound
+    zarr_paths = sorted(data_dir.glob("*.zarr"))
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        for lines in executor.map(summarize_store, zarr_paths):
+            summary_lines.extend(lines)
 
     # Write summary
     summary_path = summary_dir / "summary.md"
-    with open(summary_path, "w") as f:
-        f.writelines(summary_lines)
+    summary_path.write_text("\n".join(summary_lines) + "\n")
 
     print(f"Summary written to {summary_path}")
 
@@ -0,0 +1,19 @@
+"""Shared filesystem helpers for maintenance scripts."""
+
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+
+def discard_tree(path: Path) -> None:
+    """Remove a directory tree without blocking on per-file unlinks.
+
+    The tree is renamed out of the way (a single O(1) rename) and deleted in a
+    non-daemon background thread, so the interpreter still waits for the
+    deletion to finish before exiting.
+    """
+    trash_path = path.parent / f".trash.{path.name}.{os.getpid()}.{time.monotonic_ns()}"
+    os.rename(path, trash_path)
+    threading.Thread(target=shutil.rmtree, args=(trash_path,), daemon=False).start()
@@ -0,0 +1,57 @@
+"""Shared helpers for reading consolidated Zarr metadata in maintenance scripts."""
+
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import zarr
+from zarr.storage import DirectoryStore, KVStore
+
+# Nanoseconds per CF time unit, for the units xarray writes
+NANOSECONDS_PER_UNIT = {
+    "days": 86_400_000_000_000,
+    "hours": 3_600_000_000_000,
+    "minutes": 60_000_000_000,
+    "seconds": 1_000_000_000,
+    "milliseconds": 1_000_000,
+    "microseconds": 1_000,
+    "nanoseconds": 1,
+}
+
+
+@cache
+def load_consolidated_metadata(zarr_path: Path) -> dict[str, Any]:
+    """Read and parse a store's .zmetadata once per process."""
+    metadata: dict[str, Any] = json.loads((zarr_path / ".zmetadata").read_bytes())["metadata"]
+    return metadata
+
+
+def open_group(zarr_path: Path) -> zarr.Group:
+    """Open a store read-only, serving metadata from the in-process cache.
+
+    Only chunk reads touch the directory store; array and group metadata come
+    from the cached consolidated JSON.
+    """
+    store = KVStore(dict(load_consolidated_metadata(zarr_path)))
+    return zarr.open_group(store, mode="r", chunk_store=DirectoryStore(str(zarr_path)))
+
+
+def decode_times(values: np.ndarray, units: str) -> np.ndarray:
+    """Decode CF "<unit> since <reference>" time values to datetime64[ns].
+
+    Handles the standard calendar only, which is what xarray writes for
+    numpy datetimes, without importing xarray.
+    """
+    unit, _, reference = units.partition(" since ")
+    scale = NANOSECONDS_PER_UNIT[unit]
+    offsets = np.asarray(values)
+    if offsets.dtype.kind == "f":
+        nanoseconds = np.rint(offsets * scale).astype("int64")
+    else:
+        nanoseconds = offsets.astype("int64") * scale
+    times: np.ndarray = np.datetime64(reference.strip(), "ns") + nanoseconds.astype(
+        "timedelta64[ns]"
+    )
+    return times
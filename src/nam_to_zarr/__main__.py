@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 import sys
 from pathlib import Path
@@ -12,20 +13,28 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
 
-from nam_to_zarr.noaa.nam_conus.pressure_levels import NamConusPressureLevelsDataset
-
 app = typer.Typer(
     help="NAM to Zarr - NOAA North American Mesoscale pressure level data reformatter",
     no_args_is_help=True,
 )
 console = Console()
 
-# Dataset registry
-DATASETS: dict[str, type] = {
-    "noaa-nam-conus-pressure-levels": NamConusPressureLevelsDataset,
+# Dataset registry, as "module:class" paths resolved on demand so CLI startup
+# doesn't import the data stack
+DATASETS: dict[str, str] = {
+    "noaa-nam-conus-pressure-levels": (
+        "nam_to_zarr.noaa.nam_conus.pressure_levels:NamConusPressureLevelsDataset"
+    ),
 }
 
 
+def load_dataset_class(dataset_id: str) -> type:
+    """Import and return the dataset class registered under dataset_id."""
+    module_name, class_name = DATASETS[dataset_id].split(":")
+    dataset_class: type = getattr(importlib.import_module(module_name), class_name)
+    return dataset_class
+
+
 def setup_logging(verbose: bool = False) -> None:
     """Set up logging configuration."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -44,8 +53,8 @@ def list_datasets() -> None:
     table.add_column("ID", style="cyan")
     table.add_column("Description", style="green")
 
-    for dataset_id, dataset_class in DATASETS.items():
-        instance = dataset_class()
+    for dataset_id in DATASETS:
+        instance = load_dataset_class(dataset_id)()
         attrs = instance.template_config.dataset_attributes
         table.add_row(dataset_id, attrs.description)
 
@@ -78,7 +87,7 @@ def operational_update(
 
     try:
         logger.info(f"Starting operational update for {dataset_id}")
-        dataset_class = DATASETS[dataset_id]
+        dataset_class = load_dataset_class(dataset_id)
         dataset = dataset_class()
 
         # Run the update
@@ -104,7 +113,7 @@ def info(
         console.print("Use 'list-datasets' to see available options")
         raise typer.Exit(1)
 
-    dataset_class = DATASETS[dataset_id]
+    dataset_class = load_dataset_class(dataset_id)
     dataset = dataset_class()
     config = dataset.template_config
 
@@ -3,23 +3,69 @@
 from __future__ import annotations
 
 import logging
-import re
-import shutil
+import queue
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import numpy as np
-import pandas as pd
-import requests
-import xarray as xr
-import zarr
-from numcodecs import Zstd
+# Heavy dependencies (xarray, zarr, dask, numcodecs, requests) are imported
+# inside the methods that use them so the CLI starts quickly for commands
+# that only need dataset metadata.
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
+
+    import requests
+    import xarray as xr
 
 logger = logging.getLogger(__name__)
 
+# Number of concurrent GRIB downloads from NOMADS
+DOWNLOAD_WORKERS = 12
+
+# Number of concurrent cycle availability checks
+CYCLE_CHECK_WORKERS = 8
+
+# Number of threads decoding GRIB files while downloads and writes continue
+DECODE_WORKERS = 2
+
+# Maximum items waiting between pipeline stages (bounds decoded data in flight)
+PIPELINE_QUEUE_SIZE = 4
+
+# Forecast hours per zarr chunk along the time dimension
+TIME_CHUNK_SIZE = 12
+
+# Bytes read per iteration when streaming a GRIB download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+@cache
+def _session() -> requests.Session:
+    """Get the shared HTTP session with connection pooling and retries.
+
+    The session is created on first use and reused so connection/TLS
+    handshakes are amortized across downloads.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 @dataclass
 class DatasetAttributes:
@@ -84,6 +130,33 @@ class NamConusPressureLevelsDataset:
             "ABSV": "Absolute Vorticity",
         }
 
+        # Fixed physical ranges used to quantize each variable to int16, keyed
+        # by cfgrib variable name. Ranges are constant so the encoding stays
+        # consistent across appends.
+        self.value_ranges = {
+            "t": (150.0, 330.0),  # TMP, K
+            "r": (0.0, 100.0),  # RH, %
+            "u": (-150.0, 150.0),  # UGRD, m/s
+            "v": (-150.0, 150.0),  # VGRD, m/s
+            "gh": (-1000.0, 20000.0),  # HGT, gpm
+            "w": (-100.0, 100.0),  # VVEL, Pa/s
+            "absv": (-0.01, 0.01),  # ABSV, 1/s
+        }
+
+        # Grib filter parameters shared by every download
+        self._filter_params = {
+            # All pressure levels
+            **{f"lev_{level}_mb": "on" for level in self.pressure_levels},
+            # All variables
+            **{f"var_{var}": "on" for var in self.variables},
+            # Subregion (full CONUS grid)
+            "subregion": "",
+            "leftlon": "0",
+            "rightlon": "360",
+            "toplat": "90",
+            "bottomlat": "-90",
+        }
+
     def get_latest_cycle(self) -> tuple[datetime, str]:
         """Get the latest available NAM cycle.
 
@@ -96,31 +169,40 @@ class NamConusPressureLevelsDataset:
         # Data is typically available 3-4 hours after cycle time
         cycle_hours = [0, 6, 12, 18]
 
-        # Find the most recent cycle that should be available
+        # Candidate cycles that should be available, most recent first
+        candidates: list[datetime] = []
         for hours_ago in range(4, 24):  # Check up to 24 hours back
             check_time = now - timedelta(hours=hours_ago)
             cycle_hour = max([h for h in cycle_hours if h <= check_time.hour])
             cycle_time = check_time.replace(hour=cycle_hour, minute=0, second=0, microsecond=0)
-
-            # Check if this cycle exists
-            if self._check_cycle_exists(cycle_time):
-                cycle_str = f"{cycle_hour:02d}"
+            if cycle_time not in candidates:
+                candidates.append(cycle_time)
+
+        # Candidates on the same date share a directory; probe each unique
+        # directory once, all in a single parallel round
+        urls = list(dict.fromkeys(self._cycle_directory_url(c) for c in candidates))
+        with ThreadPoolExecutor(max_workers=CYCLE_CHECK_WORKERS) as executor:
+            available = dict(zip(urls, executor.map(self._url_exists, urls), strict=True))
+
+        for cycle_time in candidates:
+            if available[self._cycle_directory_url(cycle_time)]:
+                cycle_str = f"{cycle_time.hour:02d}"
                 logger.info(f"Found latest cycle: {cycle_time.strftime('%Y%m%d')} {cycle_str}Z")
                 return cycle_time, cycle_str
 
         msg = "Could not find available NAM cycle"
         raise RuntimeError(msg)
 
-    def _check_cycle_exists(self, cycle_time: datetime) -> bool:
-        """Check if a NAM cycle exists on NOMADS."""
+    def _cycle_directory_url(self, cycle_time: datetime) -> str:
+        """Get the NOMADS directory URL holding a NAM cycle."""
         date_str = cycle_time.strftime("%Y%m%d")
-        cycle_hour = f"{cycle_time.hour:02d}"
-
-        # Try to access the directory listing
-        url = f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/nam/prod/nam.{date_str}/"
+        return f"https://nomads.ncep.noaa.gov/pub/data/nccf/com/nam/prod/nam.{date_str}/"
 
+    def _url_exists(self, url: str) -> bool:
+        """Check if a NOMADS URL exists."""
+        # HEAD the directory listing to avoid transferring the HTML index
         try:
-            response = requests.get(url, timeout=30)
+            response = _session().head(url, timeout=10, allow_redirects=True)
             return response.status_code == 200
         except Exception:
             return False
@@ -151,100 +233,123 @@ class NamConusPressureLevelsDataset:
         # File name pattern for NAM pressure level files
         file_name = f"nam.t{cycle_hour}z.awphys{forecast_hour:02d}.tm00.grib2"
 
-        # Build filter parameters
+        # Only the file and directory vary per request
         params = {
+            **self._filter_params,
             "file": file_name,
             "dir": f"/nam.{date_str}",
         }
 
-        # Add all pressure levels
-        for level in self.pressure_levels:
-            params[f"lev_{level}_mb"] = "on"
-
-        # Add all variables
-        for var in self.variables:
-            params[f"var_{var}"] = "on"
-
-        # Add subregion (full CONUS grid)
-        params["subregion"] = ""
-        params["leftlon"] = "0"
-        params["rightlon"] = "360"
-        params["toplat"] = "90"
-        params["bottomlat"] = "-90"
-
         logger.info(f"Downloading forecast hour {forecast_hour} from cycle {date_str} {cycle_hour}Z")
 
         try:
-            response = requests.get(base_url, params=params, timeout=300)
-            response.raise_for_status()
+            with _session().get(base_url, params=params, timeout=300, stream=True) as response:
+                response.raise_for_status()
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(response.content)
+                # Stream to disk so memory stays bounded regardless of file size
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                size = 0
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        size += f.write(chunk)
 
-            logger.info(f"Downloaded {output_path.stat().st_size / 1024 / 1024:.1f} MB")
+            logger.info(f"Downloaded {size / 1024 / 1024:.1f} MB")
             return output_path
 
         except Exception as e:
             logger.error(f"Failed to download forecast hour {forecast_hour}: {e}")
             raise
 
-    def grib_to_zarr(
-        self,
-        grib_files: list[Path],
-        output_dir: Path,
-        append: bool = False,
-    ) -> Path:
-        """Convert GRIB files to Zarr format.
+    def _open_grib(self, grib_file: Path) -> xr.Dataset:
+        """Open a single GRIB file as a one-step slice of the output dataset.
 
         Args:
-            grib_files: List of GRIB file paths
-            output_dir: Output directory for Zarr store
-            append: Whether to append to existing Zarr store
+            grib_file: Path to GRIB file
 
         Returns:
-            Path to Zarr store
+            Lazily loaded dataset with (init_time, time, level, y, x) variables
         """
-        zarr_path = output_dir / "nam_conus_pressure_levels.zarr"
+        import xarray as xr
+
+        # chunks={} backs variables with dask so the dimension changes below
+        # stay lazy; data is only decoded when the caller loads it
+        ds = xr.open_dataset(
+            grib_file,
+            engine="cfgrib",
+            chunks={},
+            # cfgrib otherwise serializes all reads behind one global ecCodes
+            # lock; each decode worker reads its own file, so they can run
+            # in parallel
+            lock=False,
+            # The grib filter request only selects pressure levels, so every
+            # message is already isobaric and no client-side filter is needed
+            backend_kwargs={"indexpath": ""},
+        )
 
-        logger.info(f"Converting {len(grib_files)} GRIB files to Zarr")
+        # Promote the per-file scalar time coordinates to a time dimension
+        ds = ds.expand_dims("time")
+        for name in ("step", "valid_time"):
+            if name in ds.coords and ds[name].ndim == 0:
+                ds = ds.assign_coords({name: ds[name].expand_dims("time")})
 
-        # Open all GRIB files
-        datasets = []
-        for grib_file in sorted(grib_files):
-            try:
-                ds = xr.open_dataset(
-                    grib_file,
-                    engine="cfgrib",
-                    backend_kwargs={
-                        "filter_by_keys": {"typeOfLevel": "isobaricInhPa"},
-                        "indexpath": "",
-                    },
-                )
-                datasets.append(ds)
-            except Exception as e:
-                logger.warning(f"Failed to open {grib_file}: {e}")
-                continue
+        # Add init_time dimension for appending
+        ds = ds.expand_dims({"init_time": ds.time.values})
 
-        if not datasets:
-            msg = "No valid GRIB files to process"
-            raise RuntimeError(msg)
+        # Rename dimensions for consistency
+        if "latitude" in ds.dims:
+            ds = ds.rename({"latitude": "y", "longitude": "x"})
+        if "isobaricInhPa" in ds.dims:
+            ds = ds.rename({"isobaricInhPa": "level"})
 
-        # Concatenate along time dimension
-        combined = xr.concat(datasets, dim="time")
+        return ds
 
-        # Add init_time dimension for appending
-        init_time = combined.time.values[0]
-        combined = combined.expand_dims({"init_time": [init_time]})
+    def _forecast_hour(self, ds: xr.Dataset) -> int:
+        """Get the forecast hour of a dataset opened from one GRIB file."""
+        import numpy as np
 
-        # Rename dimensions for consistency
-        if "latitude" in combined.dims:
-            combined = combined.rename({"latitude": "y", "longitude": "x"})
-        if "isobaricInhPa" in combined.dims:
-            combined = combined.rename({"isobaricInhPa": "level"})
+        return int(ds.step.values[0] // np.timedelta64(1, "h"))
+
+    def _build_template(
+        self,
+        first: xr.Dataset,
+        forecast_hours: list[int],
+    ) -> xr.Dataset:
+        """Build a lazy template dataset covering all forecast hours.
+
+        Args:
+            first: Dataset opened from any one of the GRIB files
+            forecast_hours: Forecast hour of each time index
+
+        Returns:
+            Template dataset backed by dask arrays that are never computed
+        """
+        import dask.array as da
+        import numpy as np
+        import xarray as xr
+
+        # Index only the coordinates; data variables are rebuilt from their
+        # shape so no forecast hour is copied once per time index
+        num_times = len(forecast_hours)
+        template = first.drop_vars(list(first.data_vars)).isel(time=[0] * num_times)
+        for name, var in first.data_vars.items():
+            shape = (var.shape[0], num_times, *var.shape[2:])
+            template[name] = xr.DataArray(
+                da.zeros(shape, dtype=var.dtype, chunks=-1),
+                dims=var.dims,
+                attrs=var.attrs,
+            )
+
+        # Fill in the real step/valid_time so slots whose file is missing or
+        # fails to decode still carry correct coordinates
+        steps = np.array(forecast_hours, dtype="timedelta64[h]").astype("timedelta64[ns]")
+        template = template.assign_coords(
+            step=template.step.copy(data=steps),
+            valid_time=template.valid_time.copy(data=template.time.values + steps),
+        )
 
         # Add dataset attributes
         attrs = self.template_config.dataset_attributes
-        combined.attrs.update({
+        template.attrs.update({
             "title": attrs.title,
             "description": attrs.description,
             "provider": attrs.provider,
@@ -255,44 +360,287 @@ class NamConusPressureLevelsDataset:
             "references": attrs.references,
             "created": datetime.now(timezone.utc).isoformat(),
         })
+        return template
+
+    def _encoding(self, template: xr.Dataset) -> dict[Hashable, dict[str, Any]]:
+        """Build zarr encoding for a new store."""
+        from numcodecs import Blosc
+
+        # Chunk by time block and level so appends and single-level
+        # reads only touch the chunks they need
+        encoding: dict[Hashable, dict[str, Any]] = {}
+        for var in template.data_vars:
+            # Shuffle before zstd so smooth fields compress into long runs;
+            # bitshuffle suits raw floats, byte shuffle suits quantized int16
+            shuffle = Blosc.SHUFFLE if var in self.value_ranges else Blosc.BITSHUFFLE
+            encoding[var] = {
+                "compressor": Blosc(cname="zstd", clevel=1, shuffle=shuffle),
+                # Chunks: (1 init, 12 times, 1 level, 1/3 y, 1/3 x)
+                # Each chunk ~0.7MB uncompressed as int16 (12 * 143 * 205 * 2 bytes)
+                "chunks": (1, TIME_CHUNK_SIZE, 1, 143, 205),
+            }
+            # Quantize to int16 with CF scale_factor/add_offset. zarr v2 stores
+            # these as JSON attributes, so xarray decodes to float64; readers
+            # that want float32 must cast after opening
+            if var in self.value_ranges:
+                vmin, vmax = self.value_ranges[var]
+                encoding[var].update({
+                    "dtype": "int16",
+                    "scale_factor": (vmax - vmin) / 65534,
+                    "add_offset": (vmax + vmin) / 2,
+                    "_FillValue": -32768,
+                })
+
+        # Fix time coordinate units so whole-hour values encode exactly and
+        # appended init times (and their time values) share the store's units
+        encoding["step"] = {"units": "hours"}
+        for name in ("init_time", "time", "valid_time"):
+            encoding[name] = {"units": "hours since 1970-01-01"}
+        return encoding
+
+    def _decode_forecast_hour(self, grib_file: Path) -> xr.Dataset:
+        """Open and fully decode one forecast hour into memory."""
+        with self._open_grib(grib_file) as ds:
+            # Clip to the quantization range so int16 encoding cannot overflow
+            for var in ds.data_vars:
+                if var in self.value_ranges:
+                    vmin, vmax = self.value_ranges[var]
+                    ds[var] = ds[var].clip(vmin, vmax)
+
+            return ds.load()
+
+    def _write_time_block(
+        self,
+        hours: dict[int, xr.Dataset],
+        zarr_path: Path,
+        init_index: int,
+    ) -> None:
+        """Write decoded forecast hours from one time chunk into the store.
+
+        Contiguous runs of time indices are written as one region each, so a
+        complete block writes each of its chunks exactly once. Failures are
+        logged so the remaining hours are still written.
+        """
+        import xarray as xr
+
+        time_indices = sorted(hours)
+        runs: list[list[int]] = []
+        for time_index in time_indices:
+            if runs and runs[-1][-1] == time_index - 1:
+                runs[-1].append(time_index)
+            else:
+                runs.append([time_index])
+
+        for run in runs:
+            try:
+                ds = xr.concat(
+                    [hours[time_index] for time_index in run],
+                    dim="time",
+                    coords="minimal",
+                    compat="override",
+                )
+                # Variables without a time dimension were written with the template
+                static_vars = [
+                    name for name, var in ds.variables.items() if "time" not in var.dims
+                ]
+                ds.drop_vars(static_vars).to_zarr(
+                    zarr_path,
+                    mode="r+",
+                    region={
+                        "init_time": slice(init_index, init_index + 1),
+                        "time": slice(run[0], run[-1] + 1),
+                    },
+                    consolidated=False,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to write time indices {run[0]}-{run[-1]}: {e}")
+
+    def _decode_worker(
+        self,
+        decode_queue: queue.Queue[Path | None],
+        write_queue: queue.Queue[xr.Dataset | None],
+    ) -> None:
+        """Decode GRIB files from decode_queue and hand them to the writer."""
+        while (grib_file := decode_queue.get()) is not None:
+            try:
+                write_queue.put(self._decode_forecast_hour(grib_file))
+            except Exception as e:
+                logger.warning(f"Failed to decode {grib_file}: {e}")
+        write_queue.put(None)
+
+    def _convert(
+        self,
+        grib_files: Iterable[Path],
+        output_dir: Path,
+        append: bool,
+    ) -> Path | None:
+        """Decode and write GRIB files to Zarr as they become available.
+
+        Files flow through a bounded pipeline: a feeder thread drains
+        grib_files into a decode queue, decode workers turn them into
+        in-memory datasets, and the calling thread writes them into their
+        regions. Bounded queues apply backpressure on decoding.
+
+        Decoded hours are buffered per TIME_CHUNK_SIZE block and each block
+        is written once it is complete, so every chunk is written once rather
+        than once per forecast hour. Blocks left incomplete by missing or
+        failed files are written at the end.
+
+        The store always spans self.forecast_hours; each decoded file is
+        placed at the time index of its own forecast step.
+
+        Args:
+            grib_files: GRIB file paths, in any order
+            output_dir: Output directory for Zarr store
+            append: Whether to append to existing Zarr store
+
+        Returns:
+            Path to Zarr store, or None if no file could be decoded
+        """
+        zarr_path = output_dir / "nam_conus_pressure_levels.zarr"
+
+        time_indices = {hour: index for index, hour in enumerate(self.forecast_hours)}
+        num_times = len(self.forecast_hours)
+
+        decode_queue: queue.Queue[Path | None] = queue.Queue(PIPELINE_QUEUE_SIZE)
+        write_queue: queue.Queue[xr.Dataset | None] = queue.Queue(PIPELINE_QUEUE_SIZE)
+
+        def feed() -> None:
+            try:
+                for grib_file in grib_files:
+                    decode_queue.put(grib_file)
+            finally:
+                # Always release the decode workers, even if grib_files fails
+                for _ in range(DECODE_WORKERS):
+                    decode_queue.put(None)
+
+        init_index: int | None = None
+        error: Exception | None = None
+        # Decoded hours awaiting a write, keyed by time block then time index
+        pending: dict[int, dict[int, xr.Dataset]] = {}
+        with ThreadPoolExecutor(max_workers=DECODE_WORKERS + 1) as executor:
+            feeder = executor.submit(feed)
+            for _ in range(DECODE_WORKERS):
+                executor.submit(self._decode_worker, decode_queue, write_queue)
+
+            # Forecast hours share time chunks, so all regions are written
+            # from this single thread to avoid concurrent read-modify-write
+            # of a chunk
+            finished = 0
+            while finished < DECODE_WORKERS:
+                ds = write_queue.get()
+                if ds is None:
+                    finished += 1
+                    continue
+                if error is not None:
+                    # Keep draining so decode workers never block on a full queue
+                    continue
+
+                forecast_hour = self._forecast_hour(ds)
+                if forecast_hour not in time_indices:
+                    logger.warning(f"Skipping unexpected forecast hour {forecast_hour}")
+                    continue
+
+                if init_index is None:
+                    try:
+                        # Write metadata and coordinates only; data is filled in per region
+                        template = self._build_template(ds, self.forecast_hours)
+                        init_index = self._write_template(template, zarr_path, append)
+                    except Exception as e:
+                        error = e
+                        continue
+
+                time_index = time_indices[forecast_hour]
+                block = time_index // TIME_CHUNK_SIZE
+                hours = pending.setdefault(block, {})
+                hours[time_index] = ds
+                if len(hours) == min(TIME_CHUNK_SIZE, num_times - block * TIME_CHUNK_SIZE):
+                    self._write_time_block(pending.pop(block), zarr_path, init_index)
+
+            feeder.result()
+
+        # Write blocks that never filled up because some hours are missing
+        if init_index is not None:
+            for block in sorted(pending):
+                self._write_time_block(pending[block], zarr_path, init_index)
+
+        if error is not None:
+            raise error
+        if init_index is None:
+            return None
+
+        logger.info(f"Zarr store created/updated at {zarr_path}")
+        return zarr_path
+
+    def _write_template(self, template: xr.Dataset, zarr_path: Path, append: bool) -> int:
+        """Initialize or extend the store from the template.
+
+        Returns:
+            Index along init_time where this run's data belongs
+        """
+        import zarr
 
-        # Write to Zarr
         if append and zarr_path.exists():
             logger.info("Appending to existing Zarr store")
-            # Don't provide encoding when appending - it will use existing encoding
-            combined.to_zarr(
+            init_index = int(zarr.open_group(str(zarr_path), mode="r")["init_time"].shape[0])
+            # Don't provide encoding when appending - it will use existing encoding.
+            # Consolidating here keeps .zmetadata in step with the new shape;
+            # the region writes that follow don't change metadata.
+            template.to_zarr(
                 zarr_path,
                 mode="a",
                 append_dim="init_time",
+                compute=False,
                 consolidated=True,
             )
-        else:
-            logger.info(f"Creating new Zarr store at {zarr_path}")
-            # Configure chunking and compression only for new stores
-            # Chunk to stay under GitHub's 100MB file limit
-            # Split spatially into 3x3 grid = 9 chunks per variable
-            encoding = {}
-            for var in combined.data_vars:
-                encoding[var] = {
-                    "compressor": Zstd(level=3),
-                    # Chunks: (1 init, all times, all levels, 1/3 y, 1/3 x)
-                    # = 9 files per variable (7 vars * 9 = 63 files total)
-                    # Each file ~40-60MB (safely under 100MB limit)
-                    "chunks": (1, combined.dims["time"], len(self.pressure_levels), 143, 205),
-                }
-            combined.to_zarr(
-                zarr_path,
-                mode="w",
-                encoding=encoding,
-                consolidated=True,
-            )
+            return init_index
+
+        logger.info(f"Creating new Zarr store at {zarr_path}")
+        template.to_zarr(
+            zarr_path,
+            mode="w",
+            encoding=self._encoding(template),
+            compute=False,
+            consolidated=True,
+        )
+        return 0
+
+    def grib_to_zarr(
+        self,
+        grib_files: list[Path],
+        output_dir: Path,
+        append: bool = False,
+    ) -> Path:
+        """Convert GRIB files to Zarr format.
+
+        The store is initialized from a lazy template spanning all forecast
+        hours, then each file is decoded and written into the region of its
+        own forecast step. Decoded hours are held in memory until their time
+        chunk is complete, so about one chunk of forecast hours is buffered.
+
+        Args:
+            grib_files: List of GRIB file paths
+            output_dir: Output directory for Zarr store
+            append: Whether to append to existing Zarr store
+
+        Returns:
+            Path to Zarr store
+        """
+        logger.info(f"Converting {len(grib_files)} GRIB files to Zarr")
+
+        zarr_path = self._convert(grib_files, output_dir, append)
+        if zarr_path is None:
+            msg = "No valid GRIB files to process"
+            raise RuntimeError(msg)
 
-        logger.info(f"Zarr store created/updated at {zarr_path}")
         return zarr_path
 
     def operational_update(self, output_dir: Path) -> None:
         """Run operational update for NAM pressure levels.
 
+        Downloads, decoding and zarr writes run as a pipeline, so each file
+        is converted as soon as it has been downloaded.
+
         Args:
             output_dir: Output directory for Zarr store
         """
@@ -304,27 +652,35 @@ class NamConusPressureLevelsDataset:
         # Create temporary directory for GRIB files
         with tempfile.TemporaryDirectory() as tmpdir:
             tmp_path = Path(tmpdir)
-            grib_files = []
-
-            # Download all forecast hours
-            for fhour in self.forecast_hours:
-                try:
-                    grib_file = tmp_path / f"nam_f{fhour:03d}.grib2"
-                    self.download_grib_file(cycle_time, cycle_hour, fhour, grib_file)
-                    grib_files.append(grib_file)
-                except Exception as e:
-                    logger.warning(f"Failed to download forecast hour {fhour}: {e}")
-                    continue
 
-            if not grib_files:
+            # Download all forecast hours concurrently (network-bound)
+            with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+                futures = {
+                    executor.submit(
+                        self.download_grib_file,
+                        cycle_time,
+                        cycle_hour,
+                        fhour,
+                        tmp_path / f"nam_f{fhour:03d}.grib2",
+                    ): fhour
+                    for fhour in self.forecast_hours
+                }
+
+                def downloaded() -> Iterator[Path]:
+                    for future in as_completed(futures):
+                        try:
+                            yield future.result()
+                        except Exception as e:
+                            logger.warning(
+                                f"Failed to download forecast hour {futures[future]}: {e}"
+                            )
+                            continue
+
+                # Convert to Zarr (always create fresh - workflow handles history)
+                zarr_path = self._convert(downloaded(), output_dir, append=False)
+
+            if zarr_path is None:
                 msg = "No GRIB files downloaded"
                 raise RuntimeError(msg)
 
-            # Convert to Zarr (always create fresh - workflow handles history)
-            zarr_path = self.grib_to_zarr(
-                grib_files,
-                output_dir,
-                append=False,
-            )
-
             logger.info(f"Operational update complete: {zarr_path}")
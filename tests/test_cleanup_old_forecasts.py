@@ -0,0 +1,42 @@
+"""Tests for scripts/cleanup_old_forecasts.py."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+from cleanup_old_forecasts import truncate_in_place
+
+
+def write_store(path: Path) -> xr.Dataset:
+    """Write a small store shaped like the NAM output and return its contents."""
+    init_times = pd.date_range("2026-10-14", periods=5, freq="6h", unit="ns")
+    rng = np.random.default_rng(0)
+    ds = xr.Dataset(
+        {
+            "t": (("init_time", "time", "y"), rng.random((5, 4, 3), dtype="float32")),
+            "latitude": (("y",), np.arange(3, dtype="float32")),
+        },
+        coords={"init_time": init_times, "time": np.arange(4)},
+    )
+    ds.to_zarr(path, mode="w", encoding={"t": {"chunks": (1, 2, 3)}}, consolidated=True)
+    return ds
+
+
+def test_truncate_in_place_matches_isel(tmp_path: Path) -> None:
+    path = tmp_path / "store.zarr"
+    expected = write_store(path).isel(init_time=slice(2, None))
+
+    assert truncate_in_place(path, "init_time", 2)
+
+    with xr.open_zarr(path, consolidated=True) as actual:
+        xr.testing.assert_identical(actual.load(), expected)
+    # Chunks beyond the new shape are deleted by the resize
+    assert not (path / "t" / "3.0.0").exists()
+
+
+def test_truncate_in_place_rejects_non_leading_dimension(tmp_path: Path) -> None:
+    path = tmp_path / "store.zarr"
+    write_store(path)
+
+    assert not truncate_in_place(path, "time", 1)
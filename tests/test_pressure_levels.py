@@ -0,0 +1,155 @@
+"""Tests for the NAM CONUS pressure levels dataset handler."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from nam_to_zarr.noaa.nam_conus import pressure_levels
+from nam_to_zarr.noaa.nam_conus.pressure_levels import NamConusPressureLevelsDataset
+
+INIT_TIME = np.datetime64("2026-10-15T00:00", "ns")
+
+
+def forecast_hour_dataset(hour: int) -> xr.Dataset:
+    """Build a small dataset shaped like one decoded GRIB file."""
+    step = np.array([hour], dtype="timedelta64[h]").astype("timedelta64[ns]")
+    data = np.full((1, 1, 2, 3, 4), 200.0 + hour, dtype="float32")
+    return xr.Dataset(
+        {"t": (("init_time", "time", "level", "y", "x"), data)},
+        coords={
+            "init_time": [INIT_TIME],
+            "time": [INIT_TIME],
+            "step": ("time", step),
+            "valid_time": ("time", INIT_TIME + step),
+            "level": [1000, 500],
+        },
+    )
+
+
+@pytest.fixture
+def dataset(monkeypatch: pytest.MonkeyPatch) -> NamConusPressureLevelsDataset:
+    """Dataset handler whose GRIB decoding reads the hour from the file name.
+
+    Files named ``bad*`` fail to decode.
+    """
+    dataset = NamConusPressureLevelsDataset()
+    dataset.forecast_hours = list(range(14))
+
+    def decode(grib_file: Path) -> xr.Dataset:
+        if grib_file.name.startswith("bad"):
+            msg = f"corrupt GRIB file {grib_file}"
+            raise ValueError(msg)
+        return forecast_hour_dataset(int(grib_file.stem))
+
+    monkeypatch.setattr(dataset, "_decode_forecast_hour", decode)
+    return dataset
+
+
+def test_grib_to_zarr_skips_failed_and_missing_hours(
+    dataset: NamConusPressureLevelsDataset,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    # Hour 5 fails to decode and hour 13 is missing entirely
+    hours = [hour for hour in range(13) if hour != 5]
+    grib_files = [Path(f"{hour}.grib2") for hour in reversed(hours)] + [Path("bad.grib2")]
+
+    written: list[list[int]] = []
+    write_time_block = dataset._write_time_block
+
+    def record(hours: dict[int, xr.Dataset], zarr_path: Path, init_index: int) -> None:
+        written.append(sorted(hours))
+        write_time_block(hours, zarr_path, init_index)
+
+    monkeypatch.setattr(dataset, "_write_time_block", record)
+
+    zarr_path = dataset.grib_to_zarr(grib_files, tmp_path)
+
+    # Each time block is written once, incomplete blocks at the end
+    assert sorted(written) == [[0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11], [12]]
+
+    with xr.open_zarr(zarr_path, consolidated=True) as ds:
+        np.testing.assert_array_equal(
+            ds.step.values,
+            np.array(dataset.forecast_hours, dtype="timedelta64[h]").astype("timedelta64[ns]"),
+        )
+        values = ds.t.isel(init_time=0, level=0, y=0, x=0).values
+    expected = np.array([np.nan if hour in (5, 13) else 200.0 + hour for hour in range(14)])
+    np.testing.assert_allclose(values, expected, atol=0.01)
+
+
+def test_grib_to_zarr_appends_with_hourly_init_time_units(
+    dataset: NamConusPressureLevelsDataset,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    dataset.grib_to_zarr([Path("0.grib2")], tmp_path)
+
+    def next_cycle(grib_file: Path) -> xr.Dataset:
+        ds = forecast_hour_dataset(int(grib_file.stem))
+        later = INIT_TIME + np.timedelta64(6, "h")
+        return ds.assign_coords(init_time=[later], time=[later], valid_time=later + ds.step)
+
+    monkeypatch.setattr(dataset, "_decode_forecast_hour", next_cycle)
+    zarr_path = dataset.grib_to_zarr([Path("0.grib2")], tmp_path, append=True)
+
+    with xr.open_zarr(zarr_path, consolidated=True) as ds:
+        np.testing.assert_array_equal(
+            ds.init_time.values, [INIT_TIME, INIT_TIME + np.timedelta64(6, "h")]
+        )
+        assert ds.init_time.encoding["units"] == "hours since 1970-01-01"
+
+
+def test_grib_to_zarr_raises_when_nothing_decodes(
+    dataset: NamConusPressureLevelsDataset,
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(RuntimeError, match="No valid GRIB files"):
+        dataset.grib_to_zarr([Path("bad0.grib2"), Path("bad1.grib2")], tmp_path)
+
+
+def test_grib_to_zarr_propagates_template_failure(
+    dataset: NamConusPressureLevelsDataset,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    def fail(template: xr.Dataset, zarr_path: Path, append: bool) -> int:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(dataset, "_write_template", fail)
+
+    grib_files = [Path(f"{hour}.grib2") for hour in dataset.forecast_hours]
+    with pytest.raises(OSError, match="disk full"):
+        dataset.grib_to_zarr(grib_files, tmp_path)
+
+
+def test_get_latest_cycle_probes_each_directory_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    class FixedDatetime(datetime):
+        @classmethod
+        def now(cls, tz: object = None) -> "FixedDatetime":
+            return cls(2026, 10, 15, 5, 30, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(pressure_levels, "datetime", FixedDatetime)
+
+    dataset = NamConusPressureLevelsDataset()
+    probed: list[str] = []
+
+    def url_exists(url: str) -> bool:
+        probed.append(url)
+        return "nam.20261014" in url
+
+    monkeypatch.setattr(dataset, "_url_exists", url_exists)
+
+    cycle_time, cycle_hour = dataset.get_latest_cycle()
+
+    # Four candidate cycles span two dates, so only two directories are probed
+    assert sorted(probed) == [
+        "https://nomads.ncep.noaa.gov/pub/data/nccf/com/nam/prod/nam.20261014/",
+        "https://nomads.ncep.noaa.gov/pub/data/nccf/com/nam/prod/nam.20261015/",
+    ]
+    assert cycle_time == datetime(2026, 10, 14, 18, tzinfo=timezone.utc)
+    assert cycle_hour == "18"